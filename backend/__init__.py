@@ -1,16 +1,36 @@
 import os
 from flask import Flask
-from .models import db
+from sqlalchemy.orm import configure_mappers
+from .extensions import db
+from .json_provider import ORJSONProvider
+from . import models  # noqa: F401  (registers models on db.metadata)
+from .commands import create_partitions, refresh_views
 from .routes import bp
 
 
 def create_app():
     """Factory to create and configure the Flask app."""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    database_url = os.getenv('DATABASE_URL', 'sqlite:///arivu.db')
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    # WHY: Many concurrent gevent requests share the pool; drop dead connections on checkout.
+    engine_options = {'pool_pre_ping': True}
+    if not database_url.startswith('sqlite'):
+        # HOW: LIFO checkout keeps a small set of warm connections busy; SQLite's
+        # pool classes do not accept sizing options.
+        engine_options.update(
+            pool_size=int(os.getenv('DB_POOL_SIZE', 5)),
+            max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 5)),
+            pool_timeout=30,
+            pool_recycle=1800,
+            pool_use_lifo=True,
+        )
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
     db.init_app(app)
-    app.config['SQLALCHEMY_DATABASE_URI'] = (
-        os.getenv('DATABASE_URL', 'sqlite:///arivu.db')
-    )
+    # WHY: Build the mapper/relationship graph at boot, not on the first request.
+    configure_mappers()
     app.register_blueprint(bp)
+    app.cli.add_command(refresh_views)
+    app.cli.add_command(create_partitions)
     return app
-
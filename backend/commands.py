@@ -0,0 +1,46 @@
+"""Flask CLI commands for scheduled maintenance tasks."""
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .extensions import db
+
+# Materialized views refreshed by `refresh-views`; each needs a unique index.
+MATERIALIZED_VIEWS = ('mv_current_stock', 'mv_product_sales')
+
+
+@click.command('refresh-views')
+@with_appcontext
+def refresh_views():
+    """Refresh materialized views without blocking readers.
+    WHY: Dashboards read pre-aggregated views; they must be refreshed periodically.
+    HOW: Schedule `flask --app backend refresh-views` from cron every few minutes.
+    """
+    for view in MATERIALIZED_VIEWS:
+        db.session.execute(text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {view}'))
+    db.session.commit()
+    click.echo(f'Refreshed {len(MATERIALIZED_VIEWS)} materialized view(s).')
+
+
+@click.command('create-partitions')
+@with_appcontext
+def create_partitions():
+    """Create this month's and next month's Alerts partitions.
+    WHY: Rows for a month without its own partition land in alerts_default;
+         create_alerts_partition moves them into the new partition (migration 011).
+    HOW: Schedule `flask --app backend create-partitions` from cron (monthly or daily).
+         Each month runs in its own transaction so one failure does not block the other.
+    """
+    failed = False
+    for month in ('CURRENT_DATE', "(CURRENT_DATE + INTERVAL '1 month')::date"):
+        try:
+            db.session.execute(text(f'SELECT create_alerts_partition({month})'))
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            click.echo(f'Failed to create Alerts partition for {month}: {e}', err=True)
+            failed = True
+    if failed:
+        raise click.exceptions.Exit(1)
+    click.echo('Alerts partitions are in place for this month and next.')
@@ -0,0 +1,6 @@
+"""Flask extension instances shared across the backend package."""
+from flask_sqlalchemy import SQLAlchemy
+
+# WHY: A single SQLAlchemy instance keeps every model on one metadata/registry.
+# HOW: Import as `from .extensions import db`; never instantiate SQLAlchemy elsewhere.
+db = SQLAlchemy()
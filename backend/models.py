@@ -1,16 +1,351 @@
-"""SQLAlchemy models mapping to database tables."""
-from flask_sqlalchemy import SQLAlchemy
+"""SQLAlchemy models mapping to database tables.
 
-# WHY: Provide ORM mappings for easier DB access; extend with more models later.
-db = SQLAlchemy()
+Table names are the lower-case forms PostgreSQL folds the unquoted
+identifiers in ``db/migrations`` to (see schemadb.md - Section II).
+Large free-text columns are ``deferred``; queries that need them should
+request them with ``undefer()``.
+
+Relationships keep the default lazy loading; eager-load at the query site:
+``joinedload`` for many-to-one/one-to-one (e.g. ``Batch.product``,
+``Order.retailer``) and ``selectinload`` for one-to-many/many-to-many
+collections (e.g. ``Order.order_items``, ``Retailer.orders``), which a JOIN
+would multiply into duplicate parent rows.
+"""
+from sqlalchemy.orm import deferred
+
+from .extensions import db
+
+
+class PricingTier(db.Model):
+    __tablename__ = 'pricingtiers'
+    __table_args__ = (
+        db.CheckConstraint(
+            'min_discount_percentage >= 0 AND min_discount_percentage <= 100',
+            name='ck_pricingtiers_min_discount'),
+        db.CheckConstraint(
+            'max_discount_percentage >= 0 AND max_discount_percentage <= 100',
+            name='ck_pricingtiers_max_discount'),
+    )
+
+    tier_id = db.Column(db.Integer, primary_key=True)
+    tier_name = db.Column(db.String(100), unique=True, nullable=False)
+    min_discount_percentage = db.Column(db.Numeric(5, 2), nullable=False)
+    max_discount_percentage = db.Column(db.Numeric(5, 2), nullable=False)
+    description = db.Column(db.Text)
+    is_active = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    retailers = db.relationship('Retailer', back_populates='pricing_tier')
 
 
 class Product(db.Model):
-    __tablename__ = 'Products'
+    __tablename__ = 'products'
+    __table_args__ = (
+        db.CheckConstraint('mrp >= 0', name='ck_products_mrp'),
+        db.CheckConstraint('weight_per_unit >= 0', name='ck_products_weight_per_unit'),
+        db.CheckConstraint('shelf_life_days >= 0', name='ck_products_shelf_life_days'),
+    )
 
     product_id = db.Column(db.Integer, primary_key=True)
     sku = db.Column(db.String(50), unique=True, nullable=False)
-    product_name = db.Column(db.String(200), nullable=False)
+    upc_ean = db.Column(db.String(20), unique=True)
+    product_name = db.Column(db.String(255), nullable=False)
+    description = deferred(db.Column(db.Text))
+    category = db.Column(db.String(100))
+    brand = db.Column(db.String(100))
+    mrp = db.Column(db.Numeric(10, 2), nullable=False)
+    weight_per_unit = db.Column(db.Numeric(10, 3))
+    unit_of_measure = db.Column(db.String(20))
+    shelf_life_days = db.Column(db.Integer)
+    storage_requirements = db.Column(db.String(255))
+    is_perishable = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    batches = db.relationship('Batch', back_populates='product')
+
+
+class Batch(db.Model):
+    __tablename__ = 'batches'
+    __table_args__ = (
+        db.CheckConstraint('initial_quantity >= 0', name='ck_batches_initial_quantity'),
+        db.CheckConstraint('current_quantity >= 0', name='ck_batches_current_quantity'),
+        db.CheckConstraint(
+            "status IN ('Received','In Stock','Dispatched','Expired','Recalled')",
+            name='ck_batches_status'),
+        db.UniqueConstraint(
+            'product_id', 'manufacturer_batch_number',
+            name='uq_batches_product_batch_number'),
+        db.Index('idx_batches_created_at_brin', 'created_at', postgresql_using='brin'),
+        db.Index('idx_batches_fefo',
+                 'product_id', 'status', 'expiration_date', 'production_date'),
+        db.Index('idx_batches_expiration_status', 'expiration_date', 'status'),
+        db.Index('idx_batches_expiring_in_stock', 'expiration_date',
+                 postgresql_where=db.text("status = 'In Stock' AND current_quantity > 0")),
+    )
+
+    batch_id = db.Column(db.Integer, primary_key=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('products.product_id'), nullable=False)
+    manufacturer_batch_number = db.Column(db.String(100), nullable=False)
+    production_date = db.Column(db.Date, nullable=False)
+    expiration_date = db.Column(db.Date, nullable=False)
+    initial_quantity = db.Column(db.Numeric(10, 2), nullable=False)
+    current_quantity = db.Column(db.Numeric(10, 2), nullable=False)
+    status = db.Column(db.String(50), nullable=False)
+    manufacturing_location = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    product = db.relationship('Product', back_populates='batches')
+    inventory = db.relationship('Inventory', back_populates='batch')
+    quality_checks = db.relationship('QualityCheck', back_populates='batch')
+
+
+class Retailer(db.Model):
+    __tablename__ = 'retailers'
+    __table_args__ = (
+        db.CheckConstraint(
+            "account_status IN ('Active','Inactive','On Hold')",
+            name='ck_retailers_account_status'),
+    )
+
+    retailer_id = db.Column(db.Integer, primary_key=True)
+    retailer_name = db.Column(db.String(255), nullable=False)
+    contact_person = db.Column(db.String(255))
+    email = db.Column(db.String(255), unique=True)
+    phone_number = db.Column(db.String(50))
+    address = deferred(db.Column(db.Text))
+    city = db.Column(db.String(100))
+    state = db.Column(db.String(100))
+    zip_code = db.Column(db.String(20))
+    pricing_tier_id = db.Column(db.Integer, db.ForeignKey('pricingtiers.tier_id'))
+    account_status = db.Column(db.String(50), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    pricing_tier = db.relationship('PricingTier', back_populates='retailers')
+    orders = db.relationship('Order', back_populates='retailer')
+
+
+class Inventory(db.Model):
+    __tablename__ = 'inventory'
+    __table_args__ = (
+        db.CheckConstraint('quantity_on_hand >= 0', name='ck_inventory_quantity_on_hand'),
+        db.CheckConstraint('reorder_point >= 0', name='ck_inventory_reorder_point'),
+        db.Index('idx_inventory_low_stock', 'batch_id',
+                 postgresql_where=db.text('quantity_on_hand <= reorder_point')),
+    )
+
+    inventory_id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.Integer, db.ForeignKey('batches.batch_id'), nullable=False)
+    location = db.Column(db.String(255), nullable=False)
+    quantity_on_hand = db.Column(db.Numeric(10, 2), nullable=False)
+    reorder_point = db.Column(db.Numeric(10, 2))
+    last_updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    batch = db.relationship('Batch', back_populates='inventory')
+
+
+class Order(db.Model):
+    __tablename__ = 'orders'
+    __table_args__ = (
+        db.CheckConstraint('total_amount >= 0', name='ck_orders_total_amount'),
+        db.CheckConstraint(
+            "order_status IN ('Pending','Processing','Fulfilled','Shipped','Delivered','Cancelled')",
+            name='ck_orders_order_status'),
+        db.Index('idx_orders_retailer_status_date',
+                 'retailer_id', 'order_status', 'order_date'),
+        db.Index('idx_orders_status_date', 'order_status', 'order_date'),
+    )
+
+    order_id = db.Column(db.Integer, primary_key=True)
+    retailer_id = db.Column(db.Integer, db.ForeignKey('retailers.retailer_id'), nullable=False)
+    order_date = db.Column(db.DateTime, nullable=False)
+    total_amount = db.Column(db.Numeric(12, 2), nullable=False)
+    order_status = db.Column(db.String(50), nullable=False)
+    delivery_address = deferred(db.Column(db.Text, nullable=False))
+    expected_delivery_date = db.Column(db.Date)
+    discount_applied_overall = db.Column(db.Numeric(5, 2), default=0)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    retailer = db.relationship('Retailer', back_populates='orders')
+    # Line items are owned by the order: appending to order.order_items inserts
+    # them in the same flush as the parent, with no explicit flush for order_id.
+    order_items = db.relationship(
+        'OrderItem', back_populates='order', cascade='all, delete-orphan')
+    shipments = db.relationship('Shipment', back_populates='order')
+
+
+class OrderItem(db.Model):
+    __tablename__ = 'orderitems'
+    __table_args__ = (
+        db.CheckConstraint('quantity > 0', name='ck_orderitems_quantity'),
+        db.CheckConstraint('unit_price >= 0', name='ck_orderitems_unit_price'),
+        db.CheckConstraint('line_total >= 0', name='ck_orderitems_line_total'),
+        db.UniqueConstraint(
+            'order_id', 'product_id', 'batch_id',
+            name='uq_orderitems_order_product_batch'),
+        # NULL batch_ids never conflict above; this covers lines without a batch.
+        db.Index('uq_orderitems_order_product_no_batch', 'order_id', 'product_id',
+                 unique=True,
+                 postgresql_where=db.text('batch_id IS NULL'),
+                 sqlite_where=db.text('batch_id IS NULL')),
+    )
+
+    order_item_id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('orders.order_id'), nullable=False)
+    product_id = db.Column(db.Integer, db.ForeignKey('products.product_id'), nullable=False)
+    batch_id = db.Column(db.Integer, db.ForeignKey('batches.batch_id'))
+    quantity = db.Column(db.Numeric(10, 2), nullable=False)
+    unit_price = db.Column(db.Numeric(10, 2), nullable=False)
+    line_total = db.Column(db.Numeric(12, 2), nullable=False)
+    discount_percentage = db.Column(db.Numeric(5, 2), default=0)
+    actual_sales_price = db.Column(db.Numeric(10, 2), nullable=False)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    order = db.relationship('Order', back_populates='order_items')
+    product = db.relationship('Product')
+    batch = db.relationship('Batch')
+
+
+class Shipment(db.Model):
+    __tablename__ = 'shipments'
+    __table_args__ = (
+        db.CheckConstraint(
+            "shipment_status IN ('Pending','In Transit','Delivered','Failed')",
+            name='ck_shipments_shipment_status'),
+        db.Index('idx_shipments_dispatch_date_brin', 'dispatch_date', postgresql_using='brin'),
+    )
+
+    shipment_id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('orders.order_id'), nullable=False)
+    carrier_name = db.Column(db.String(100))
+    tracking_number = db.Column(db.String(100), unique=True)
+    dispatch_date = db.Column(db.DateTime, nullable=False)
+    delivery_date = db.Column(db.DateTime)
+    shipment_status = db.Column(db.String(50), nullable=False)
+    estimated_cost = db.Column(db.Numeric(10, 2))
+    actual_cost = db.Column(db.Numeric(10, 2))
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    order = db.relationship('Order', back_populates='shipments')
+
+
+class User(db.Model):
+    __tablename__ = 'users'
+    __table_args__ = (
+        db.CheckConstraint(
+            "role IN ('Admin','Sales','Warehouse','Logistics','Quality Control')",
+            name='ck_users_role'),
+    )
+
+    user_id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(100), unique=True, nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    email = db.Column(db.String(255), unique=True, nullable=False)
+    first_name = db.Column(db.String(100))
+    last_name = db.Column(db.String(100))
+    role = db.Column(db.String(50), nullable=False)
+    is_active = db.Column(db.Boolean, default=True)
+    last_login_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+
+class QualityCheck(db.Model):
+    __tablename__ = 'qualitychecks'
+    __table_args__ = (
+        db.CheckConstraint(
+            "result IN ('Pass','Fail','Conditional')",
+            name='ck_qualitychecks_result'),
+        db.Index('idx_qualitychecks_check_date_brin', 'check_date', postgresql_using='brin'),
+    )
+
+    check_id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.Integer, db.ForeignKey('batches.batch_id'), nullable=False)
+    check_date = db.Column(db.DateTime, nullable=False)
+    checked_by = db.Column(db.Integer, db.ForeignKey('users.user_id'))
+    result = db.Column(db.String(50), nullable=False)
+    notes = deferred(db.Column(db.Text))
+    issue_description = deferred(db.Column(db.Text))
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    batch = db.relationship('Batch', back_populates='quality_checks')
+    checker = db.relationship('User')
+
+
+class Alert(db.Model):
+    __tablename__ = 'alerts'
+    __table_args__ = (
+        db.CheckConstraint(
+            "alert_type IN ('Expiration','Low Stock','Recall','Quality Issue')",
+            name='ck_alerts_alert_type'),
+        db.CheckConstraint(
+            "status IN ('New','Acknowledged','Resolved')",
+            name='ck_alerts_status'),
+        db.Index('idx_alerts_alert_date_brin', 'alert_date', postgresql_using='brin'),
+        db.Index('idx_alerts_lookup', 'alert_type', 'target_table', 'target_id', 'status'),
+        db.Index('idx_alerts_status_date', 'status', 'alert_date'),
+    )
+
+    # In PostgreSQL the table is partitioned by alert_date with PK (alert_id, alert_date)
+    # (migration 005); alert_id alone comes from a sequence and identifies a row, so the
+    # model keys on it, which also keeps SQLite autoincrement working for development.
+    alert_id = db.Column(db.Integer, db.Sequence('alerts_alert_id_seq'), primary_key=True)
+    alert_type = db.Column(db.String(50), nullable=False)
+    target_id = db.Column(db.Integer, nullable=False)
+    target_table = db.Column(db.String(50), nullable=False)
+    message = deferred(db.Column(db.Text, nullable=False))
+    threshold_value = db.Column(db.Numeric(10, 2))
+    alert_date = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    status = db.Column(db.String(50), nullable=False)
+    resolved_by = db.Column(db.Integer, db.ForeignKey('users.user_id'))
+    resolved_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+
+    resolver = db.relationship('User')
+
+
+class CurrentStock(db.Model):
+    """Read-only mapping of the ``mv_current_stock`` materialized view.
+
+    The view is created by migration 004; it lives on its own MetaData so
+    ``db.create_all()`` never tries to create it as a table.
+    """
+    __table__ = db.Table(
+        'mv_current_stock', db.MetaData(),
+        db.Column('product_id', db.Integer, primary_key=True),
+        db.Column('location', db.String(255), primary_key=True),
+        db.Column('qty', db.Numeric(12, 2)),
+    )
+
+
+class ProductSales(db.Model):
+    """Read-only mapping of the ``mv_product_sales`` materialized view (migration 010)."""
+    __table__ = db.Table(
+        'mv_product_sales', db.MetaData(),
+        db.Column('product_id', db.Integer, primary_key=True),
+        db.Column('total_sales', db.Numeric(14, 2)),
+        db.Column('total_qty', db.Numeric(14, 2)),
+    )
 
-    # HOW: Add additional fields based on schemadb when expanding features.
 
+class InventoryEnriched(db.Model):
+    """Read-only mapping of the ``vw_inventory_enriched`` view (migration 009)."""
+    __table__ = db.Table(
+        'vw_inventory_enriched', db.MetaData(),
+        db.Column('inventory_id', db.Integer, primary_key=True),
+        db.Column('batch_id', db.Integer),
+        db.Column('location', db.String(255)),
+        db.Column('quantity_on_hand', db.Numeric(10, 2)),
+        db.Column('reorder_point', db.Numeric(10, 2)),
+        db.Column('last_updated_at', db.DateTime),
+        db.Column('days_to_expiry', db.Integer),
+        db.Column('is_low_stock', db.Boolean),
+    )
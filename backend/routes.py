@@ -1,8 +1,101 @@
-from flask import Blueprint, jsonify
+from datetime import datetime
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+from sqlalchemy import func, select, tuple_
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import is_resource_modified
+
+from .extensions import db
+from .models import Order, ProductSales
 
 # Blueprint for API routes
 bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Serialized once at import; probes hit /health far more often than any other route.
+_HEALTH_BODY = b'{"status":"ok"}'
+
+# Columns returned by list endpoints; rows are serialized without ORM hydration.
+ORDER_COLUMNS = (
+    Order.order_id,
+    Order.retailer_id,
+    Order.order_date,
+    Order.total_amount,
+    Order.order_status,
+)
+PRODUCT_SALES_COLUMNS = (
+    ProductSales.product_id,
+    ProductSales.total_sales,
+    ProductSales.total_qty,
+)
+# Built once at import; requests only add WHERE clauses, and SQLAlchemy's
+# compiled cache reuses the SQL string for each filter combination.
+_ORDERS_STMT = select(*ORDER_COLUMNS).order_by(Order.order_date.desc(), Order.order_id.desc())
+
+# Upper bound of PostgreSQL INT, used by the SERIAL primary keys.
+_INT_MAX = 2**31 - 1
+
+
+def _limit_arg(default=50, max_=500):
+    """Read ``?limit=`` clamped to ``[1, max_]``."""
+    return min(max(request.args.get('limit', default, type=int), 1), max_)
+
+
+def _valid_id(value):
+    """True if ``value`` fits the SERIAL (INT) primary keys; larger ints overflow the driver."""
+    return 0 < value <= _INT_MAX
+
+
+def _id_arg(name):
+    """Read an integer id from ``?<name>=``, aborting with 400 if it is out of range."""
+    value = request.args.get(name, type=int)
+    if value is not None and not _valid_id(value):
+        abort(400, description=f'Invalid {name}')
+    return value
+
+
+def _parse_order_cursor(cursor):
+    """Decode an orders ``after`` cursor of the form ``<order_date ISO>,<order_id>``."""
+    try:
+        order_date, order_id = cursor.rsplit(',', 1)
+        order_date, order_id = datetime.fromisoformat(order_date), int(order_id)
+    except ValueError:
+        abort(400, description='Invalid cursor')
+    if not _valid_id(order_id):
+        abort(400, description='Invalid cursor')
+    return order_date, order_id
+
+
+def _page_validators(stmt, limit):
+    """Return ``(etag, last_modified)`` for the page ``stmt.limit(limit + 1)`` would return.
+    WHY: Computed from a keys-only aggregate over the same index range, so a matching
+         If-None-Match / If-Modified-Since answers 304 before rows are fetched or encoded.
+    HOW: count and sum(order_id) change when rows enter or leave the page; max(updated_at)
+         changes when a row on it is edited.
+    """
+    page = stmt.with_only_columns(Order.order_id, Order.updated_at).limit(limit + 1).subquery()
+    count, id_sum, last_modified = db.session.execute(
+        select(func.count(), func.sum(page.c.order_id), func.max(page.c.updated_at))
+    ).one()
+    stamp = last_modified.isoformat() if last_modified else ''
+    return f'{count}-{id_sum or 0}-{stamp}', last_modified
+
+
+@bp.app_errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Log unhandled errors once and return a constant JSON body.
+    WHY: Routes stay free of per-handler try/except and never leak exception text.
+    HOW: Registered app-wide so routing errors (404, 405) are covered too. HTTP errors
+         keep their status code and headers (e.g. ``Allow``) with a JSON body.
+    """
+    if isinstance(e, HTTPException):
+        response = e.get_response()
+        response.set_data(current_app.json.dumps({'error': e.description}))
+        response.content_type = 'application/json'
+        return response
+    db.session.rollback()
+    current_app.logger.exception(e)
+    return jsonify({'error': 'internal'}), 500
+
 
 @bp.route('/health', methods=['GET'])
 def health_check():
@@ -11,5 +104,54 @@ def health_check():
     WHAT: closes initial setup ticket.
     HOW: Extend by adding authentication; roll back by removing blueprint registration.
     """
-    return jsonify({'status': 'ok'})
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
+
+@bp.route('/orders', methods=['GET'])
+def get_orders():
+    """List orders newest first, optionally filtered by ``retailer_id`` and ``status``.
+    WHY: Selecting columns through Core skips ORM instance construction per row;
+         keyset pagination (``?limit=&after=``) seeks instead of scanning an OFFSET.
+    HOW: Pass the returned ``next_cursor`` as ``after`` to fetch the next page. Responses
+         carry ETag / Last-Modified; revalidations that still match get a bodiless 304.
+    """
+    stmt = _ORDERS_STMT
+    retailer_id = _id_arg('retailer_id')
+    if retailer_id is not None:
+        stmt = stmt.where(Order.retailer_id == retailer_id)
+    status = request.args.get('status')
+    if status:
+        stmt = stmt.where(Order.order_status == status)
+    after = request.args.get('after')
+    if after:
+        stmt = stmt.where(tuple_(Order.order_date, Order.order_id) < _parse_order_cursor(after))
+    limit = _limit_arg()
+    etag, last_modified = _page_validators(stmt, limit)
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        rows = db.session.execute(stmt.limit(limit + 1)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f'{rows[-1].order_date.isoformat()},{rows[-1].order_id}'
+        response = jsonify({
+            'data': [dict(row._mapping) for row in rows],
+            'next_cursor': next_cursor,
+        })
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    return response
+
 
+@bp.route('/analytics/product-sales', methods=['GET'])
+def get_product_sales():
+    """Per-product sales totals, best sellers first, capped by ``?limit=``.
+    WHY: Reads the pre-aggregated ``mv_product_sales`` view instead of grouping
+         OrderItems on every request; ``refresh-views`` keeps it current.
+    """
+    stmt = (select(*PRODUCT_SALES_COLUMNS)
+            .order_by(ProductSales.total_sales.desc(), ProductSales.product_id)
+            .limit(_limit_arg()))
+    rows = db.session.execute(stmt).all()
+    return jsonify({'data': [dict(row._mapping) for row in rows]})
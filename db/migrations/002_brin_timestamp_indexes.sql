@@ -0,0 +1,14 @@
+-- BRIN indexes on append-only timestamp columns
+-- Rows are inserted in time order, so per-heap-range min/max summaries stay
+-- tight and range scans ("last 24h", "this month") skip non-matching ranges.
+-- The btree on Batches(expiration_date) from 001 is kept for boundary lookups.
+-- Orders(order_date) keeps its 001 btree instead: it also serves the
+-- newest-first ORDER BY of the orders list, which a BRIN cannot.
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_alerts_alert_date_brin ON Alerts USING BRIN (alert_date);
+CREATE INDEX IF NOT EXISTS idx_batches_created_at_brin ON Batches USING BRIN (created_at);
+CREATE INDEX IF NOT EXISTS idx_shipments_dispatch_date_brin ON Shipments USING BRIN (dispatch_date);
+CREATE INDEX IF NOT EXISTS idx_qualitychecks_check_date_brin ON QualityChecks USING BRIN (check_date);
+
+COMMIT;
@@ -0,0 +1,35 @@
+-- Composite UNIQUE constraints on natural keys
+-- Lets batch receipt and order-line writes use INSERT ... ON CONFLICT
+-- instead of a SELECT-then-INSERT round trip, and guards against duplicates.
+-- OrderItems.batch_id is nullable and NULLs never conflict in a UNIQUE
+-- constraint, so lines without a batch get their own partial unique index;
+-- upsert those with ON CONFLICT (order_id, product_id) WHERE batch_id IS NULL.
+BEGIN;
+
+-- Existing duplicates would abort the ALTERs below; fail with a clear message
+-- instead so they can be merged first.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM Batches
+               GROUP BY product_id, manufacturer_batch_number HAVING COUNT(*) > 1) THEN
+        RAISE EXCEPTION 'Batches has duplicate (product_id, manufacturer_batch_number) rows; merge them before applying 003';
+    END IF;
+    IF EXISTS (SELECT 1 FROM OrderItems
+               GROUP BY order_id, product_id, batch_id HAVING COUNT(*) > 1) THEN
+        RAISE EXCEPTION 'OrderItems has duplicate (order_id, product_id, batch_id) lines; merge them before applying 003';
+    END IF;
+END;
+$$;
+
+ALTER TABLE Batches
+    ADD CONSTRAINT uq_batches_product_batch_number
+    UNIQUE (product_id, manufacturer_batch_number);
+
+ALTER TABLE OrderItems
+    ADD CONSTRAINT uq_orderitems_order_product_batch
+    UNIQUE (order_id, product_id, batch_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_orderitems_order_product_no_batch
+    ON OrderItems(order_id, product_id) WHERE batch_id IS NULL;
+
+COMMIT;
@@ -0,0 +1,17 @@
+-- Materialized view: current stock per product per location
+-- Dashboards read this pre-aggregated view instead of summing Inventory on
+-- every load. Refresh with `flask --app backend refresh-views` (e.g. from cron).
+BEGIN;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_current_stock AS
+SELECT b.product_id, i.location, SUM(i.quantity_on_hand) AS qty
+FROM Inventory i
+JOIN Batches b ON i.batch_id = b.batch_id
+WHERE b.status = 'In Stock'
+GROUP BY b.product_id, i.location;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_current_stock_product_location
+    ON mv_current_stock(product_id, location);
+
+COMMIT;
@@ -0,0 +1,64 @@
+-- Partition Alerts by month on alert_date
+-- Alert queries target recent rows; monthly partitions let the planner prune
+-- to the current month and keep its indexes hot. PostgreSQL requires the
+-- partition key in the primary key, so the PK becomes (alert_id, alert_date).
+-- Orders is intentionally not partitioned: OrderItems and Shipments reference
+-- Orders(order_id) alone, which a partitioned Orders cannot enforce.
+BEGIN;
+
+ALTER TABLE Alerts RENAME TO alerts_unpartitioned;
+ALTER SEQUENCE alerts_alert_id_seq OWNED BY NONE;
+
+CREATE TABLE Alerts (
+    alert_id INT NOT NULL DEFAULT nextval('alerts_alert_id_seq'),
+    alert_type VARCHAR(50) NOT NULL CHECK (alert_type IN ('Expiration','Low Stock','Recall','Quality Issue')),
+    target_id INT NOT NULL,
+    target_table VARCHAR(50) NOT NULL,
+    message TEXT NOT NULL,
+    threshold_value DECIMAL(10,2),
+    alert_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    status VARCHAR(50) NOT NULL CHECK (status IN ('New','Acknowledged','Resolved')),
+    resolved_by INT REFERENCES Users(user_id),
+    resolved_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (alert_id, alert_date)
+) PARTITION BY RANGE (alert_date);
+
+ALTER SEQUENCE alerts_alert_id_seq OWNED BY Alerts.alert_id;
+
+-- Catch-all for history and for months whose partition was not created in time
+CREATE TABLE IF NOT EXISTS alerts_default PARTITION OF Alerts DEFAULT;
+
+-- Creates the monthly partition containing month_start (idempotent)
+CREATE OR REPLACE FUNCTION create_alerts_partition(month_start DATE) RETURNS VOID AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month_start)::date;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF Alerts FOR VALUES FROM (%L) TO (%L)',
+        'alerts_' || to_char(start_date, 'YYYY_MM'),
+        start_date,
+        (start_date + INTERVAL '1 month')::date
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT create_alerts_partition(CURRENT_DATE);
+SELECT create_alerts_partition((CURRENT_DATE + INTERVAL '1 month')::date);
+
+INSERT INTO Alerts
+SELECT alert_id, alert_type, target_id, target_table, message, threshold_value,
+       COALESCE(alert_date, created_at, CURRENT_TIMESTAMP), status, resolved_by,
+       resolved_at, created_at, updated_at
+FROM alerts_unpartitioned;
+
+DROP TABLE alerts_unpartitioned;
+
+-- Recreate indexes from 001/002 on the partitioned parent
+-- (the status index is superseded by idx_alerts_status_date in 007)
+CREATE INDEX IF NOT EXISTS idx_alerts_resolved_by ON Alerts(resolved_by);
+CREATE INDEX IF NOT EXISTS idx_alerts_type ON Alerts(alert_type);
+CREATE INDEX IF NOT EXISTS idx_alerts_alert_date_brin ON Alerts USING BRIN (alert_date);
+
+COMMIT;
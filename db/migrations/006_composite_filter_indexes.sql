@@ -0,0 +1,16 @@
+-- Composite indexes for the common filter patterns
+-- Batches: FEFO allocation (product, In Stock, earliest expiry first)
+-- Alerts: "is there already an open alert for this target?" probes
+-- Orders: per-retailer listings filtered by status, newest first; its
+--   retailer_id prefix also serves the FK lookups, superseding the 001 index
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_batches_product_status_expiration
+    ON Batches(product_id, status, expiration_date);
+CREATE INDEX IF NOT EXISTS idx_alerts_lookup
+    ON Alerts(alert_type, target_table, target_id, status);
+CREATE INDEX IF NOT EXISTS idx_orders_retailer_status_date
+    ON Orders(retailer_id, order_status, order_date);
+DROP INDEX IF EXISTS idx_orders_retailer_id;
+
+COMMIT;
@@ -0,0 +1,17 @@
+-- Status + date indexes for "newest first" listings and low-stock scans
+-- Btree indexes are scanned backwards for ORDER BY ... DESC, so plain
+-- ascending columns serve both directions. Each leads with the status column,
+-- so it supersedes the single-column status index from 001.
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_orders_status_date ON Orders(order_status, order_date);
+CREATE INDEX IF NOT EXISTS idx_alerts_status_date ON Alerts(status, alert_date);
+DROP INDEX IF EXISTS idx_orders_status;
+DROP INDEX IF EXISTS idx_alerts_status;
+
+-- quantity_on_hand <= reorder_point compares two columns, which a composite
+-- btree cannot range-scan; a partial index holds just the low-stock rows.
+CREATE INDEX IF NOT EXISTS idx_inventory_low_stock ON Inventory(batch_id)
+    WHERE quantity_on_hand <= reorder_point;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- FEFO allocation and expiry-scan indexes on Batches
+-- FEFO reads order by (expiration_date, production_date) within a product's
+-- In Stock batches; including production_date lets the index supply the
+-- full ordering with no sort step. It supersedes the 006 index.
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_batches_fefo
+    ON Batches(product_id, status, expiration_date, production_date);
+DROP INDEX IF EXISTS idx_batches_product_status_expiration;
+
+-- Cross-product expiry scans (expiration_date <= :cutoff AND status = ...)
+CREATE INDEX IF NOT EXISTS idx_batches_expiration_status
+    ON Batches(expiration_date, status);
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- View: inventory enriched with expiry and low-stock flags
+-- Computes days_to_expiry and is_low_stock in SQL so readers copy plain
+-- values instead of doing per-row date math in Python.
+BEGIN;
+
+CREATE OR REPLACE VIEW vw_inventory_enriched AS
+SELECT i.inventory_id, i.batch_id, i.location, i.quantity_on_hand,
+       i.reorder_point, i.last_updated_at,
+       b.expiration_date - CURRENT_DATE AS days_to_expiry,
+       (i.quantity_on_hand <= i.reorder_point) AS is_low_stock
+FROM Inventory i
+JOIN Batches b ON i.batch_id = b.batch_id;
+
+-- days_to_expiry depends on CURRENT_DATE and cannot be indexed; near-expiry
+-- alert scans use this partial index on the underlying date instead.
+CREATE INDEX IF NOT EXISTS idx_batches_expiring_in_stock ON Batches(expiration_date)
+    WHERE status = 'In Stock' AND current_quantity > 0;
+
+COMMIT;
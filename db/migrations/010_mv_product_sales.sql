@@ -0,0 +1,19 @@
+-- Materialized view: lifetime sales totals per product
+-- Sales reporting reads pre-aggregated totals instead of grouping OrderItems
+-- on every request. Lines on Cancelled orders are not sales and are excluded.
+-- Refreshed by `flask --app backend refresh-views`; read by
+-- GET /api/analytics/product-sales.
+BEGIN;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_product_sales AS
+SELECT oi.product_id, SUM(oi.line_total) AS total_sales, SUM(oi.quantity) AS total_qty
+FROM OrderItems oi
+JOIN Orders o ON o.order_id = oi.order_id
+WHERE o.order_status <> 'Cancelled'
+GROUP BY oi.product_id;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_product_sales_product
+    ON mv_product_sales(product_id);
+
+COMMIT;
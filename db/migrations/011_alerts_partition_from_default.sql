@@ -0,0 +1,34 @@
+-- Let create_alerts_partition adopt rows already sitting in alerts_default
+-- PostgreSQL refuses to create a partition whose range overlaps rows in the
+-- DEFAULT partition, so a cron run that comes after the month has started
+-- would fail forever. The function now detaches the default, creates the
+-- partition, moves the month's rows into it, and reattaches the default,
+-- all inside the caller's transaction.
+BEGIN;
+
+CREATE OR REPLACE FUNCTION create_alerts_partition(month_start DATE) RETURNS VOID AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month_start)::date;
+    end_date DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'alerts_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE Alerts DETACH PARTITION alerts_default;
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF Alerts FOR VALUES FROM (%L) TO (%L)',
+        partition_name, start_date, end_date
+    );
+    -- Rows inserted through the parent are routed to the new partition
+    INSERT INTO Alerts
+    SELECT * FROM alerts_default
+    WHERE alert_date >= start_date AND alert_date < end_date;
+    DELETE FROM alerts_default
+    WHERE alert_date >= start_date AND alert_date < end_date;
+    ALTER TABLE Alerts ATTACH PARTITION alerts_default DEFAULT;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
@@ -0,0 +1,21 @@
+"""Gunicorn configuration for production deployments.
+
+Run with: gunicorn 'backend:create_app()'
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+# WHY: Requests are dominated by DB round-trips; gevent multiplexes them per worker.
+worker_class = 'gevent'
+# One gevent worker per core is enough for I/O-bound requests; each worker opens up to
+# DB_POOL_SIZE + DB_MAX_OVERFLOW connections, and the total must fit max_connections.
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 500))
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension gevent cannot monkeypatch; make it yield to the hub.
+    # DATABASE_URL must name the driver (postgresql+psycopg2://) for this to apply.
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
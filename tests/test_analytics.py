@@ -0,0 +1,35 @@
+"""Tests for the analytics endpoints backed by materialized views."""
+from decimal import Decimal
+
+import pytest
+
+from backend import create_app
+from backend.extensions import db
+from backend.models import ProductSales
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
+    app = create_app()
+    with app.app_context():
+        # SQLite has no materialized views; a plain table with the view's columns stands in.
+        ProductSales.__table__.create(db.engine)
+        db.session.execute(ProductSales.__table__.insert(), [
+            {'product_id': 1, 'total_sales': Decimal('10.00'), 'total_qty': Decimal('2.00')},
+            {'product_id': 2, 'total_sales': Decimal('99.50'), 'total_qty': Decimal('7.00')},
+            {'product_id': 3, 'total_sales': Decimal('10.00'), 'total_qty': Decimal('1.00')},
+        ])
+        db.session.commit()
+        yield app.test_client()
+
+
+def test_product_sales_best_sellers_first(client):
+    body = client.get('/api/analytics/product-sales').get_json()
+    assert [row['product_id'] for row in body['data']] == [2, 1, 3]
+    assert body['data'][0] == {'product_id': 2, 'total_sales': '99.50', 'total_qty': '7.00'}
+
+
+def test_product_sales_limit(client):
+    body = client.get('/api/analytics/product-sales?limit=1').get_json()
+    assert [row['product_id'] for row in body['data']] == [2]
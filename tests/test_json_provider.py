@@ -0,0 +1,35 @@
+"""Tests for the orjson-backed JSON provider."""
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from backend import create_app
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
+    return create_app()
+
+
+def test_decimal_is_serialized_as_string(app):
+    assert app.json.dumps({'amount': Decimal('10.50')}) == '{"amount":"10.50"}'
+
+
+def test_dates_are_iso_8601(app):
+    assert app.json.dumps([datetime(2025, 1, 2, 3, 4, 5), date(2025, 1, 2)]) == \
+        '["2025-01-02T03:04:05","2025-01-02"]'
+
+
+def test_non_string_keys_are_stringified(app):
+    assert app.json.dumps({1: 'a'}) == '{"1":"a"}'
+
+
+def test_unsupported_type_raises(app):
+    with pytest.raises(TypeError):
+        app.json.dumps({'value': object()})
+
+
+def test_loads_round_trips(app):
+    assert app.json.loads('{"a":[1,2]}') == {'a': [1, 2]}
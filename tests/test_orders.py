@@ -0,0 +1,149 @@
+"""Tests for GET /api/orders and the API blueprint's response hooks."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend import create_app
+from backend.extensions import db
+from backend.models import Order, PricingTier, Retailer
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        db.session.add(PricingTier(tier_id=1, tier_name='Gold',
+                                   min_discount_percentage=20, max_discount_percentage=30))
+        db.session.add(Retailer(retailer_id=1, retailer_name='R1',
+                                account_status='Active', pricing_tier_id=1))
+        # Several orders share each order_date so pages split inside a tie.
+        for i in range(9):
+            db.session.add(Order(retailer_id=1, order_date=datetime(2025, 1, 1 + i // 3),
+                                 total_amount=Decimal('10.50'), order_status='Pending',
+                                 delivery_address='x'))
+        db.session.commit()
+        yield app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def test_cursor_pages_do_not_overlap_on_tied_dates(client):
+    seen, after = [], None
+    while True:
+        query = {'limit': 2}
+        if after:
+            query['after'] = after
+        body = client.get('/api/orders', query_string=query).get_json()
+        seen.extend(row['order_id'] for row in body['data'])
+        after = body['next_cursor']
+        if after is None:
+            break
+    assert sorted(seen) == list(range(1, 10))
+    assert len(seen) == len(set(seen))
+
+
+def test_filters_by_retailer_and_status(app, client):
+    db.session.add(Retailer(retailer_id=2, retailer_name='R2',
+                            account_status='Active', pricing_tier_id=1))
+    db.session.add(Order(retailer_id=2, order_date=datetime(2025, 2, 1),
+                         total_amount=Decimal('5.00'), order_status='Shipped',
+                         delivery_address='y'))
+    db.session.commit()
+
+    rows = client.get('/api/orders?retailer_id=2').get_json()['data']
+    assert [row['order_id'] for row in rows] == [10]
+    rows = client.get('/api/orders?status=Pending').get_json()['data']
+    assert len(rows) == 9 and all(row['order_status'] == 'Pending' for row in rows)
+    rows = client.get('/api/orders?retailer_id=1&status=Shipped').get_json()['data']
+    assert rows == []
+
+
+def test_rows_are_serialized_from_the_projection(client):
+    row = client.get('/api/orders?limit=1').get_json()['data'][0]
+    assert row == {'order_id': 9, 'retailer_id': 1, 'order_date': '2025-01-03T00:00:00',
+                   'total_amount': '10.50', 'order_status': 'Pending'}
+
+
+def test_bad_cursor_returns_json_400(client):
+    response = client.get('/api/orders?after=not-a-cursor')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid cursor'}
+
+
+@pytest.mark.parametrize('query', [
+    'after=2025-01-01T00:00:00,99999999999999999999999',
+    'after=2025-01-01T00:00:00,0',
+    'retailer_id=99999999999999999999999',
+])
+def test_out_of_range_ids_return_400(client, query):
+    response = client.get(f'/api/orders?{query}')
+    assert response.status_code == 400
+    assert response.is_json
+
+
+def test_if_none_match_returns_304_without_the_page_query(app, client):
+    etag = client.get('/api/orders').headers['ETag']
+    statements = []
+    event.listen(db.engine, 'before_cursor_execute',
+                 lambda *args: statements.append(args[2]))
+    response = client.get('/api/orders', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+    assert len(statements) == 1
+
+
+def test_if_modified_since_returns_304(client):
+    last_modified = client.get('/api/orders').headers['Last-Modified']
+    response = client.get('/api/orders', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+
+
+def test_etag_changes_when_a_row_on_the_page_changes(app, client):
+    etag = client.get('/api/orders?limit=2').headers['ETag']
+    db.session.get(Order, 9).updated_at = datetime(2030, 1, 1)
+    db.session.commit()
+    response = client.get('/api/orders?limit=2', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_etag_changes_when_a_row_leaves_the_page(app, client):
+    etag = client.get('/api/orders?limit=2').headers['ETag']
+    db.session.delete(db.session.get(Order, 8))
+    db.session.commit()
+    response = client.get('/api/orders?limit=2', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_health_has_no_etag(client):
+    response = client.get('/api/health')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+
+
+def test_unknown_route_returns_json_404(client):
+    response = client.get('/api/nope')
+    assert response.status_code == 404
+    assert response.is_json and 'error' in response.get_json()
+
+
+def test_wrong_method_returns_json_405_with_allow(client):
+    response = client.post('/api/orders')
+    assert response.status_code == 405
+    assert response.is_json
+    assert 'GET' in response.headers['Allow']
+
+
+def test_unexpected_error_returns_internal_json(app, client):
+    db.drop_all()
+    response = client.get('/api/orders')
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'internal'}